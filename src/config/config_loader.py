@@ -6,21 +6,17 @@ Loads environment variables from .env file and provides
 configuration settings for the application.
 
 Features:
-- Loads .env file if present
+- Loads .env file if present (simple KEY=VALUE parser, no dependencies)
 - Graceful degradation if .env is missing
 - Type-safe configuration access
 """
 
+import logging
 import os
 from pathlib import Path
 from typing import Dict, Optional
 
-try:
-    from dotenv import load_dotenv
-    DOTENV_AVAILABLE = True
-except ImportError:
-    DOTENV_AVAILABLE = False
-    print("Warning: python-dotenv not installed. Environment variables from .env will not be loaded.")
+log = logging.getLogger(__name__)
 
 
 class Config:
@@ -52,16 +48,33 @@ class Config:
     def _load_environment(self) -> None:
         """
         Load environment variables from .env file if it exists.
-        Fails silently if file doesn't exist or dotenv is not available.
-        """
-        if not DOTENV_AVAILABLE:
-            return
+        Fails silently if file doesn't exist.
+        
+        Only plain KEY=VALUE lines are supported; blank lines and '#'
+        comments are skipped. Variables already set in the environment
+        take precedence over the file.
         
+        Settings are read from the environment once here and cached,
+        so accessors don't repeat os.getenv lookups.
+        """
         if self.env_path.exists():
-            load_dotenv(self.env_path)
-            print(f"✓ Loaded environment from {self.env_path}")
+            for line in self.env_path.read_text(encoding='utf-8').splitlines():
+                line = line.strip()
+                if not line or line.startswith('#') or '=' not in line:
+                    continue
+                key, _, value = line.partition('=')
+                value = value.strip()
+                if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+                    value = value[1:-1]
+                os.environ.setdefault(key.strip(), value)
+            log.info("✓ Loaded environment from %s", self.env_path)
         else:
-            print(f"ℹ No .env file found at {self.env_path}")
+            log.info("ℹ No .env file found at %s", self.env_path)
+        
+        self._cfg = {
+            'app_version': os.getenv('APP_VERSION', '1.0.0'),
+            'debug': os.getenv('DEBUG', 'false').lower() == 'true',
+        }
     
     def get_app_version(self) -> str:
         """
@@ -70,7 +83,7 @@ class Config:
         Returns:
             Application version string.
         """
-        return os.getenv('APP_VERSION', '1.0.0')
+        return self._cfg['app_version']
     
     def is_debug_mode(self) -> bool:
         """
@@ -79,7 +92,7 @@ class Config:
         Returns:
             True if DEBUG environment variable is set to 'true'.
         """
-        return os.getenv('DEBUG', 'false').lower() == 'true'
+        return self._cfg['debug']
     
     def get_config_summary(self) -> str:
         """
@@ -5,14 +5,17 @@ Keyboard Manager
 Handles virtual keyboard control and hotkey detection.
 """
 
+import logging
 from typing import Callable, Optional
 
+log = logging.getLogger(__name__)
+
 try:
     from pynput import keyboard
     PYNPUT_AVAILABLE = True
 except ImportError:
     PYNPUT_AVAILABLE = False
-    print("ERROR: 'pynput' is not installed. Run: pip install pynput")
+    log.error("'pynput' is not installed. Run: pip install pynput")
 
 
 class KeyboardManager:
@@ -31,6 +34,7 @@ class KeyboardManager:
         self.ctrl_controller = keyboard.Controller()
         self.simulated_ctrl_held = False
         self.selected_hotkey = '5'
+        self._triggers = self._build_triggers(self.selected_hotkey)
         self.on_hotkey_callback = on_hotkey_callback
         self.listener: Optional[keyboard.Listener] = None
     
@@ -39,14 +43,14 @@ class KeyboardManager:
         if self.listener is None:
             self.listener = keyboard.Listener(on_press=self._on_key_press)
             self.listener.start()
-            print("✓ Keyboard listener started")
+            log.info("✓ Keyboard listener started")
     
     def stop_listening(self) -> None:
         """Stop keyboard listener."""
         if self.listener:
             self.listener.stop()
             self.listener = None
-            print("✓ Keyboard listener stopped")
+            log.info("✓ Keyboard listener stopped")
     
     def press_ctrl(self) -> bool:
         """
@@ -58,10 +62,10 @@ class KeyboardManager:
         try:
             self.ctrl_controller.press(keyboard.Key.ctrl_l)
             self.simulated_ctrl_held = True
-            print("✓ CTRL key pressed and held virtually")
+            log.debug("✓ CTRL key pressed and held virtually")
             return True
         except Exception as e:
-            print(f"Warning: Could not simulate CTRL press: {e}")
+            log.warning("Could not simulate CTRL press: %s", e)
             return False
     
     def release_ctrl(self) -> bool:
@@ -75,10 +79,10 @@ class KeyboardManager:
             if self.simulated_ctrl_held:
                 self.ctrl_controller.release(keyboard.Key.ctrl_l)
                 self.simulated_ctrl_held = False
-                print("✓ CTRL key released")
+                log.debug("✓ CTRL key released")
             return True
         except Exception as e:
-            print(f"Warning: Could not release CTRL: {e}")
+            log.warning("Could not release CTRL: %s", e)
             return False
     
     def set_hotkey(self, key: str) -> None:
@@ -89,7 +93,22 @@ class KeyboardManager:
             key: The hotkey character (e.g., '4' or '5')
         """
         self.selected_hotkey = key
-        print(f"✓ Hotkey set to: {key}")
+        self._triggers = self._build_triggers(key)
+        log.debug("✓ Hotkey set to: %s", key)
+    
+    @staticmethod
+    def _build_triggers(key: str) -> frozenset:
+        """
+        Build the set of key identifiers that fire the hotkey.
+        
+        Contains the character itself and its virtual-key code (VK codes
+        for '0'-'9' equal their ASCII values), so CTRL+number combinations,
+        which report no usable char, are still detected.
+        
+        Args:
+            key: The hotkey character (e.g., '4' or '5')
+        """
+        return frozenset((key, ord(key)))
     
     def _on_key_press(self, key) -> None:
         """
@@ -99,27 +118,15 @@ class KeyboardManager:
             key: The key that was pressed
         """
         try:
-            # Character detection
-            if hasattr(key, 'char') and key.char == self.selected_hotkey:
+            # Single set lookup on char, then VK code for CTRL+number
+            triggers = self._triggers
+            if (getattr(key, 'char', None) in triggers
+                    or getattr(key, 'vk', None) in triggers):
                 if self.on_hotkey_callback:
                     self.on_hotkey_callback(self.selected_hotkey)
-                print(f"✓ Key {self.selected_hotkey} pressed (char detection)")
-                return
-            
-            # VK code detection for CTRL+number combinations
-            if hasattr(key, 'vk'):
-                if self.selected_hotkey == '4' and key.vk == 0x34:
-                    if self.on_hotkey_callback:
-                        self.on_hotkey_callback('4')
-                    print("✓ Key 4 pressed (vk detection)")
-                elif self.selected_hotkey == '5' and key.vk == 0x35:
-                    if self.on_hotkey_callback:
-                        self.on_hotkey_callback('5')
-                    print("✓ Key 5 pressed (vk detection)")
-        except AttributeError:
-            pass
+                log.debug("Key %s pressed", self.selected_hotkey)
         except Exception as e:
-            print(f"Keyboard listener error: {e}")
+            log.warning("Keyboard listener error: %s", e)
     
     def cleanup(self) -> None:
         """Clean up resources and release any held keys."""
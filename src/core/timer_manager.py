@@ -5,8 +5,12 @@ Timer Manager
 Manages countdown timer logic and state.
 """
 
+import logging
+import time
 from typing import Callable, Optional
 
+log = logging.getLogger(__name__)
+
 
 class TimerManager:
     """Manages countdown timer state and logic."""
@@ -28,25 +32,36 @@ class TimerManager:
         self.alert_shown = False
         self.on_tick_callback = on_tick_callback
         self.on_alert_callback = on_alert_callback
+
+        # Monotonic anchor: remaining time is derived from the clock, so the
+        # UI can drive tick() at any interval without losing accuracy
+        self._t0 = 0
+        self._initial_ms = self.milliseconds
         
         # Timer thresholds
         self.alert_threshold = 5.0  # Show alert at 5 seconds
     
     def start(self) -> None:
         """Start the timer."""
+        self._t0 = time.monotonic_ns()
+        self._initial_ms = self.milliseconds
         self.is_running = True
-        print(f"▶ Timer started from {self.get_seconds():.1f}")
+        log.debug("▶ Timer started from %.1f", self.get_seconds())
     
     def stop(self) -> None:
         """Stop the timer."""
+        if self.is_running:
+            self._update_remaining()
         self.is_running = False
-        print(f"⏸ Timer stopped at {self.get_seconds():.1f}")
+        log.debug("⏸ Timer stopped at %.1f", self.get_seconds())
     
     def reset(self) -> None:
         """Reset timer to initial value."""
         self.milliseconds = 60000
         self.alert_shown = False
-        print("✓ Countdown reset to 60.0")
+        self._t0 = time.monotonic_ns()
+        self._initial_ms = self.milliseconds
+        log.debug("✓ Countdown reset to 60.0")
     
     def toggle(self) -> bool:
         """
@@ -62,12 +77,12 @@ class TimerManager:
         return self.is_running
     
     def tick(self) -> None:
-        """Process one timer tick (10ms)."""
+        """Process one timer tick, measuring elapsed time since start."""
         if not self.is_running:
             return
         
         if self.milliseconds > 0:
-            self.milliseconds -= 10
+            self._update_remaining()
             seconds = self.get_seconds()
             
             # Trigger tick callback
@@ -79,11 +94,16 @@ class TimerManager:
                 self.alert_shown = True
                 if self.on_alert_callback:
                     self.on_alert_callback()
-                print("🚨 BUFF ALERT: Countdown reached threshold!")
+                log.debug("BUFF ALERT: Countdown reached threshold")
         else:
             if self.on_tick_callback:
                 self.on_tick_callback(0.0)
     
+    def _update_remaining(self) -> None:
+        """Recompute remaining milliseconds from the monotonic clock."""
+        elapsed_ms = (time.monotonic_ns() - self._t0) // 1_000_000
+        self.milliseconds = max(self._initial_ms - elapsed_ms, 0)
+    
     def get_seconds(self) -> float:
         """Get remaining time in seconds."""
         return self.milliseconds / 1000.0
@@ -10,11 +10,15 @@ Author: MaorG
 License: MIT
 """
 
+import logging
 import sys
 from PyQt6.QtWidgets import QApplication
 
+from config.config_loader import get_config
 from ui.main_window import DarkCtrlKeeperWindow
 
+log = logging.getLogger(__name__)
+
 
 def main():
     """
@@ -23,6 +27,12 @@ def main():
     Creates the QApplication, shows the DarkCtrlKeeper window,
     and runs the event loop.
     """
+    # Hot-path diagnostics log at DEBUG level and are shown only when DEBUG=true
+    logging.basicConfig(
+        level=logging.DEBUG if get_config().is_debug_mode() else logging.WARNING,
+        format="%(message)s",
+    )
+    
     app = QApplication(sys.argv)
     app.setApplicationName("DarkCtrlKeeper")
     app.setApplicationVersion("1.0.0")
@@ -38,11 +48,11 @@ def main():
     window_geometry.moveCenter(center_point)
     window.move(window_geometry.topLeft())
     
-    print("=" * 50)
-    print("DarkCtrlKeeper is running")
-    print("Control: Use on-screen buttons to Lock or Release CTRL")
-    print("Close: Click X or press Alt+F4")
-    print("=" * 50)
+    log.info("=" * 50)
+    log.info("DarkCtrlKeeper is running")
+    log.info("Control: Use on-screen buttons to Lock or Release CTRL")
+    log.info("Close: Click X or press Alt+F4")
+    log.info("=" * 50)
     
     sys.exit(app.exec())
 
@@ -51,12 +51,19 @@ Maintains Greater Fortitude buff by virtually locking the CTRL key.</p>
 """
 
 
-def show_info_dialog(parent):
+# Info dialog is built once (HTML parse, styles, sizing) and reused
+_info_dialog = None
+
+
+def _build_info_dialog(parent) -> QDialog:
     """
-    Display information dialog about the application.
+    Build the information dialog.
     
     Args:
         parent: Parent widget
+        
+    Returns:
+        The fully configured dialog
     """
     dialog = QDialog(parent)
     dialog.setWindowTitle("DarkCtrlKeeper - Information")
@@ -109,9 +116,26 @@ def show_info_dialog(parent):
     
     dialog.resize(dialog_width, dialog_height)
     
+    return dialog
+
+
+def show_info_dialog(parent):
+    """
+    Display information dialog about the application.
+    
+    The dialog is created on first use and reused on later calls.
+    
+    Args:
+        parent: Parent widget
+    """
+    global _info_dialog
+    if _info_dialog is None or _info_dialog.parent() is not parent:
+        _info_dialog = _build_info_dialog(parent)
+    dialog = _info_dialog
+    
     # Center the dialog on screen
     dialog_geometry = dialog.frameGeometry()
-    center_point = screen.center()
+    center_point = QApplication.primaryScreen().geometry().center()
     dialog_geometry.moveCenter(center_point)
     dialog.move(dialog_geometry.topLeft())
     
@@ -7,18 +7,72 @@ The main application window that orchestrates all UI components and logic.
 
 import sys
 import os
+import logging
+from functools import lru_cache
 from PyQt6.QtWidgets import (
     QWidget, QLabel, QPushButton, QRadioButton, 
     QButtonGroup, QGraphicsDropShadowEffect
 )
 from PyQt6.QtCore import Qt, QPoint, QTimer, pyqtSignal
-from PyQt6.QtGui import QPixmap, QMouseEvent, QIcon, QColor
+from PyQt6.QtGui import QPixmap, QMouseEvent, QIcon, QColor, QImageReader
 
 from utils.resources import resource_path
 from core.keyboard_manager import KeyboardManager
 from core.timer_manager import TimerManager
 from ui.styles import *
-from ui.dialogs import show_info_dialog
+
+log = logging.getLogger(__name__)
+
+# Every window asset, resolved to an absolute path once at import
+_ASSET_PATHS = {
+    name: resource_path(f"assets/{filename}")
+    for name, filename in (
+        ('icon', "ICON.ico"),
+        ('background', "base_background.png"),
+        ('lock_active', "lock-button.png"),
+        ('lock_gray', "lock-button-gray.png"),
+        ('release_active', "released-button.png"),
+        ('release_gray', "released-button-gray.png"),
+        ('released_text', "released_TEXT.png"),
+        ('pressed_text', "pressed_TEXT.png"),
+    )
+}
+
+
+@lru_cache(maxsize=None)
+def _pixmap(name: str) -> QPixmap:
+    """
+    Load a pixmap on first use and cache it.
+    
+    Args:
+        name: Asset key in _ASSET_PATHS
+        
+    Returns:
+        The decoded pixmap
+    """
+    return QPixmap(_ASSET_PATHS[name])
+
+
+@lru_cache(maxsize=None)
+def _icon(name: str) -> QIcon:
+    """
+    Build a QIcon from a cached pixmap on first use and cache it.
+    
+    Args:
+        name: Asset key in _ASSET_PATHS
+        
+    Returns:
+        The icon wrapping the pixmap
+    """
+    return QIcon(_pixmap(name))
+
+
+# Countdown stylesheet and glow color per color zone
+_COUNTDOWN_ZONES = {
+    'green': (COUNTDOWN_STYLE_GREEN, QColor(0, 255, 0, 200)),
+    'yellow': (COUNTDOWN_STYLE_YELLOW, QColor(255, 165, 0, 200)),
+    'red': (COUNTDOWN_STYLE_RED, QColor(255, 0, 0, 200)),
+}
 
 
 class DarkCtrlKeeperWindow(QWidget):
@@ -31,6 +85,13 @@ class DarkCtrlKeeperWindow(QWidget):
     # Qt signals for thread-safe operations
     reset_countdown_signal = pyqtSignal()
     
+    # Countdown refresh interval. TimerManager measures elapsed time itself,
+    # so this only sets display granularity (the label shows tenths)
+    TICK_INTERVAL_MS = 33
+    
+    # The buff alert pulses on the same timer, every Nth frame (~100 ms)
+    ALERT_PULSE_FRAMES = 100 // TICK_INTERVAL_MS
+    
     def __init__(self):
         super().__init__()
         
@@ -50,16 +111,17 @@ class DarkCtrlKeeperWindow(QWidget):
         self.lock_is_active = True  # True = RELEASED, False = PRESSED
         self.drag_position = QPoint()
         
-        # Start keyboard listener
-        self.keyboard_mgr.start_listening()
+        # Start keyboard listener once the event loop runs, so installing
+        # the global hook doesn't delay the first paint
+        QTimer.singleShot(0, self.keyboard_mgr.start_listening)
         
-        print("✓ DarkCtrlKeeper initialized successfully")
+        log.info("✓ DarkCtrlKeeper initialized successfully")
     
     def _init_managers(self):
         """Initialize core logic managers."""
         # Keyboard manager
         self.keyboard_mgr = KeyboardManager(
-            on_hotkey_callback=lambda key: self.reset_countdown_signal.emit()
+            on_hotkey_callback=self._on_hotkey_pressed
         )
         
         # Timer manager
@@ -68,15 +130,55 @@ class DarkCtrlKeeperWindow(QWidget):
             on_alert_callback=self._on_timer_alert
         )
         
-        # QTimer for UI updates
+        # Single QTimer drives both countdown updates and the alert pulse
         self.qt_timer = QTimer(self)
-        self.qt_timer.timeout.connect(lambda: self.timer_mgr.tick())
-        
-        # Alert pulse timer
-        self.alert_pulse_timer = QTimer(self)
-        self.alert_pulse_timer.timeout.connect(self._pulse_alert)
+        self.qt_timer.timeout.connect(self._on_frame)
+        self._frame = 0
         self.alert_pulse_state = 0
     
+    # Button and status pixmaps/icons are loaded lazily; only the
+    # initially visible variants are decoded during startup
+    
+    @property
+    def lock_active_pixmap(self) -> QPixmap:
+        return _pixmap('lock_active')
+    
+    @property
+    def lock_gray_pixmap(self) -> QPixmap:
+        return _pixmap('lock_gray')
+    
+    @property
+    def release_active_pixmap(self) -> QPixmap:
+        return _pixmap('release_active')
+    
+    @property
+    def release_gray_pixmap(self) -> QPixmap:
+        return _pixmap('release_gray')
+    
+    @property
+    def released_pixmap(self) -> QPixmap:
+        return _pixmap('released_text')
+    
+    @property
+    def pressed_pixmap(self) -> QPixmap:
+        return _pixmap('pressed_text')
+    
+    @property
+    def lock_icon_active(self) -> QIcon:
+        return _icon('lock_active')
+    
+    @property
+    def lock_icon_gray(self) -> QIcon:
+        return _icon('lock_gray')
+    
+    @property
+    def release_icon_active(self) -> QIcon:
+        return _icon('release_active')
+    
+    @property
+    def release_icon_gray(self) -> QIcon:
+        return _icon('release_gray')
+    
     def _setup_window(self):
         """Setup window properties."""
         self.setWindowTitle("DarkCtrlKeeper")
@@ -85,10 +187,13 @@ class DarkCtrlKeeperWindow(QWidget):
             Qt.WindowType.FramelessWindowHint | 
             Qt.WindowType.WindowStaysOnTopHint
         )
-        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        # base_background.png is fully opaque and covers the whole window,
+        # so skip the translucent (CPU alpha-composited) window path
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
         
         # Set icon
-        icon_path = resource_path("assets/ICON.ico")
+        icon_path = _ASSET_PATHS['icon']
         if os.path.exists(icon_path):
             self.setWindowIcon(QIcon(icon_path))
     
@@ -100,15 +205,17 @@ class DarkCtrlKeeperWindow(QWidget):
         self._setup_status_text()
         self._setup_hotkey_selection()
         self._setup_countdown()
-        self._setup_control_buttons()
-        self._setup_window_buttons()
+        self._setup_text_buttons()
+        
+        # Stacking never changes, so put the buff alert on top once here
+        self.buff_alert.raise_()
     
     def _setup_background(self):
         """Setup background image."""
         self.background_label = QLabel(self)
-        bg_pixmap = QPixmap(resource_path("assets/base_background.png"))
+        bg_pixmap = _pixmap('background')
         if bg_pixmap.isNull():
-            print("ERROR: Could not load assets/base_background.png")
+            log.error("Could not load assets/base_background.png")
         self.background_label.setPixmap(bg_pixmap)
         self.background_label.setGeometry(0, 0, 356, 430)
     
@@ -118,22 +225,14 @@ class DarkCtrlKeeperWindow(QWidget):
         self.watermark_label.setGeometry(0, 68, 356, 20)
         self.watermark_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.watermark_label.setStyleSheet(WATERMARK_STYLE)
-        
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(10)
-        shadow.setColor(QColor(0, 0, 0, 180))
-        shadow.setOffset(0, 2)
-        self.watermark_label.setGraphicsEffect(shadow)
         self.watermark_label.raise_()
     
     def _setup_buttons(self):
         """Setup Lock and Release buttons."""
         # LOCK button
         self.lock_button = QPushButton(self)
-        self.lock_active_pixmap = QPixmap(resource_path("assets/lock-button.png"))
-        self.lock_gray_pixmap = QPixmap(resource_path("assets/lock-button-gray.png"))
         
-        self.lock_button.setIcon(QIcon(self.lock_active_pixmap))
+        self.lock_button.setIcon(self.lock_icon_active)
         self.lock_button.setIconSize(self.lock_active_pixmap.size())
         self.lock_button.setGeometry(45, 300, 
                                      self.lock_active_pixmap.width(), 
@@ -146,14 +245,14 @@ class DarkCtrlKeeperWindow(QWidget):
         
         # RELEASE button
         self.release_button = QPushButton(self)
-        self.release_active_pixmap = QPixmap(resource_path("assets/released-button.png"))
-        self.release_gray_pixmap = QPixmap(resource_path("assets/released-button-gray.png"))
+        # Sized from the active image header without decoding it
+        release_size = QImageReader(_ASSET_PATHS['release_active']).size()
         
-        self.release_button.setIcon(QIcon(self.release_gray_pixmap))
-        self.release_button.setIconSize(self.release_active_pixmap.size())
+        self.release_button.setIcon(self.release_icon_gray)
+        self.release_button.setIconSize(release_size)
         self.release_button.setGeometry(185, 300, 
-                                        self.release_active_pixmap.width(), 
-                                        self.release_active_pixmap.height())
+                                        release_size.width(), 
+                                        release_size.height())
         self.release_button.setFlat(True)
         self.release_button.setStyleSheet("border: none; background: transparent;")
         self.release_button.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -161,25 +260,14 @@ class DarkCtrlKeeperWindow(QWidget):
         self.release_button.setToolTip("Release CTRL key")
     
     def _setup_status_text(self):
-        """Setup status text displays."""
-        # Released text
-        self.released_text = QLabel(self)
-        released_pixmap = QPixmap(resource_path("assets/released_TEXT.png"))
-        self.released_text.setPixmap(released_pixmap)
-        self.released_text.setGeometry(120, 240, 
-                                       released_pixmap.width(), 
-                                       released_pixmap.height())
-        self.released_text.setStyleSheet("background: transparent;")
-        
-        # Pressed text
-        self.pressed_text = QLabel(self)
-        pressed_pixmap = QPixmap(resource_path("assets/pressed_TEXT.png"))
-        self.pressed_text.setPixmap(pressed_pixmap)
-        self.pressed_text.setGeometry(120, 240, 
-                                      pressed_pixmap.width(), 
-                                      pressed_pixmap.height())
-        self.pressed_text.setStyleSheet("background: transparent;")
-        self.pressed_text.setVisible(False)
+        """Setup status text display (one label, pixmap swapped on toggle)."""
+        self.status_text = QLabel(self)
+        released_pixmap = self.released_pixmap
+        self.status_text.setPixmap(released_pixmap)
+        self.status_text.setGeometry(120, 240, 
+                                     released_pixmap.width(), 
+                                     released_pixmap.height())
+        self.status_text.setStyleSheet("background: transparent;")
     
     def _setup_hotkey_selection(self):
         """Setup hotkey selection radio buttons."""
@@ -226,6 +314,7 @@ class DarkCtrlKeeperWindow(QWidget):
         """Setup countdown timer display and alert."""
         # Countdown label
         self.countdown_label = QLabel("60.0", self)
+        self._last_countdown_str = "60.0"
         self.countdown_label.setGeometry(95, 358, 170, 60)
         self.countdown_label.setStyleSheet(COUNTDOWN_LABEL_STYLE)
         self.countdown_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -233,9 +322,10 @@ class DarkCtrlKeeperWindow(QWidget):
         # Glow effect
         self.countdown_glow = QGraphicsDropShadowEffect()
         self.countdown_glow.setBlurRadius(25)
-        self.countdown_glow.setColor(QColor(0, 255, 0, 200))
+        self.countdown_glow.setColor(_COUNTDOWN_ZONES['green'][1])
         self.countdown_glow.setOffset(0, 0)
         self.countdown_label.setGraphicsEffect(self.countdown_glow)
+        self._last_zone = 'green'
         
         # Buff alert
         self.buff_alert = QLabel("BUFF", self)
@@ -250,48 +340,36 @@ class DarkCtrlKeeperWindow(QWidget):
         self.buff_alert_glow.setColor(QColor(255, 0, 0, 255))
         self.buff_alert_glow.setOffset(0, 0)
         self.buff_alert.setGraphicsEffect(self.buff_alert_glow)
+        
+        # Pulse frames (blur radius, color), indexed by alert_pulse_state
+        self._pulse_radii = (40, 25)
+        self._pulse_colors = (QColor(255, 0, 0, 255), QColor(255, 0, 0, 180))
     
-    def _setup_control_buttons(self):
-        """Setup timer control buttons."""
-        # START/STOP button
-        self.start_stop_btn = QPushButton("START", self)
-        self.start_stop_btn.setGeometry(60, 380, 60, 20)
-        self.start_stop_btn.setStyleSheet(START_STOP_BUTTON_STYLE)
-        self.start_stop_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.start_stop_btn.clicked.connect(self._toggle_timer)
-        
-        # RESET button
-        self.reset_btn = QPushButton("RESET", self)
-        self.reset_btn.setGeometry(240, 380, 60, 20)
-        self.reset_btn.setStyleSheet(RESET_BUTTON_STYLE)
-        self.reset_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.reset_btn.clicked.connect(self._reset_timer)
-    
-    def _setup_window_buttons(self):
-        """Setup window control buttons."""
-        # Info button
-        self.info_btn = QPushButton("ⓘ", self)
-        self.info_btn.setGeometry(5, 5, 30, 30)
-        self.info_btn.setStyleSheet(INFO_BUTTON_STYLE)
-        self.info_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.info_btn.clicked.connect(lambda: show_info_dialog(self))
-        self.info_btn.setToolTip("Application Information")
-        
-        # Minimize button
-        self.minimize_btn = QPushButton("−", self)
-        self.minimize_btn.setGeometry(285, 5, 30, 30)
-        self.minimize_btn.setStyleSheet(MINIMIZE_BUTTON_STYLE)
-        self.minimize_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.minimize_btn.clicked.connect(self.showMinimized)
-        self.minimize_btn.setToolTip("Minimize")
-        
-        # Close button
-        self.close_btn = QPushButton("×", self)
-        self.close_btn.setGeometry(320, 5, 30, 30)
-        self.close_btn.setStyleSheet(CLOSE_BUTTON_STYLE)
-        self.close_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.close_btn.clicked.connect(self.close)
-        self.close_btn.setToolTip("Close Application")
+    def _setup_text_buttons(self):
+        """Setup timer control and window control buttons."""
+        # (attribute, text, geometry, style, slot, tooltip)
+        specs = (
+            ('start_stop_btn', "START", (60, 380, 60, 20),
+             START_STOP_BUTTON_STYLE, self._toggle_timer, None),
+            ('reset_btn', "RESET", (240, 380, 60, 20),
+             RESET_BUTTON_STYLE, self._reset_timer, None),
+            ('info_btn', "ⓘ", (5, 5, 30, 30),
+             INFO_BUTTON_STYLE, self._on_info_clicked, "Application Information"),
+            ('minimize_btn', "−", (285, 5, 30, 30),
+             MINIMIZE_BUTTON_STYLE, self.showMinimized, "Minimize"),
+            ('close_btn', "×", (320, 5, 30, 30),
+             CLOSE_BUTTON_STYLE, self.close, "Close Application"),
+        )
+        
+        for name, text, geometry, style, slot, tooltip in specs:
+            button = QPushButton(text, self)
+            button.setGeometry(*geometry)
+            button.setStyleSheet(style)
+            button.setCursor(Qt.CursorShape.PointingHandCursor)
+            button.clicked.connect(slot)
+            if tooltip:
+                button.setToolTip(tooltip)
+            setattr(self, name, button)
     
     # Event Handlers
     
@@ -302,12 +380,11 @@ class DarkCtrlKeeperWindow(QWidget):
             self.keyboard_mgr.press_ctrl()
             
             # Update UI
-            self.lock_button.setIcon(QIcon(self.lock_gray_pixmap))
-            self.release_button.setIcon(QIcon(self.release_active_pixmap))
-            self.pressed_text.setVisible(True)
-            self.released_text.setVisible(False)
+            self.lock_button.setIcon(self.lock_icon_gray)
+            self.release_button.setIcon(self.release_icon_active)
+            self.status_text.setPixmap(self.pressed_pixmap)
             
-            print("✓ Lock button clicked - CTRL IS PRESSED")
+            log.debug("✓ Lock button clicked - CTRL IS PRESSED")
     
     def _on_release_clicked(self):
         """Handle Release button click."""
@@ -316,12 +393,17 @@ class DarkCtrlKeeperWindow(QWidget):
             self.keyboard_mgr.release_ctrl()
             
             # Update UI
-            self.release_button.setIcon(QIcon(self.release_gray_pixmap))
-            self.lock_button.setIcon(QIcon(self.lock_active_pixmap))
-            self.pressed_text.setVisible(False)
-            self.released_text.setVisible(True)
+            self.release_button.setIcon(self.release_icon_gray)
+            self.lock_button.setIcon(self.lock_icon_active)
+            self.status_text.setPixmap(self.released_pixmap)
             
-            print("✓ Release button clicked - CTRL RELEASED")
+            log.debug("✓ Release button clicked - CTRL RELEASED")
+    
+    def _on_info_clicked(self):
+        """Handle Info button click."""
+        # Imported on first use to keep the dialog module off the startup path
+        from ui.dialogs import show_info_dialog
+        show_info_dialog(self)
     
     def _on_hotkey_changed(self, button):
         """Handle hotkey selection change."""
@@ -335,10 +417,12 @@ class DarkCtrlKeeperWindow(QWidget):
         is_running = self.timer_mgr.toggle()
         
         if is_running:
-            self.qt_timer.start(10)
+            self.qt_timer.start(self.TICK_INTERVAL_MS)
             self.start_stop_btn.setText("STOP")
         else:
-            self.qt_timer.stop()
+            # Keep frames coming while the alert is pulsing
+            if not self.buff_alert.isVisible():
+                self.qt_timer.stop()
             self.start_stop_btn.setText("START")
     
     def _reset_timer(self):
@@ -348,10 +432,14 @@ class DarkCtrlKeeperWindow(QWidget):
         self._hide_buff_alert()
         
         if not self.timer_mgr.is_running:
-            self.qt_timer.start(10)
+            self.qt_timer.start(self.TICK_INTERVAL_MS)
             self.timer_mgr.start()
             self.start_stop_btn.setText("STOP")
     
+    def _on_hotkey_pressed(self, key: str):
+        """Handle hotkey press (called from the listener thread)."""
+        self.reset_countdown_signal.emit()
+    
     def _on_hotkey_reset(self):
         """Handle hotkey triggered reset."""
         self.timer_mgr.reset()
@@ -368,47 +456,47 @@ class DarkCtrlKeeperWindow(QWidget):
     
     def _update_countdown_display(self, seconds: float):
         """Update countdown label and color."""
-        self.countdown_label.setText(f"{seconds:.1f}")
+        # The label shows tenths, so most ticks render the same text
+        text = f"{seconds:.1f}"
+        if text != self._last_countdown_str:
+            self._last_countdown_str = text
+            self.countdown_label.setText(text)
         
-        # Update color based on time remaining
+        # Update color only when the zone changes; setStyleSheet re-polishes
         zone = self.timer_mgr.get_color_zone()
-        if zone == 'green':
-            color, glow = COUNTDOWN_GREEN, QColor(0, 255, 0, 200)
-        elif zone == 'yellow':
-            color, glow = COUNTDOWN_YELLOW, QColor(255, 165, 0, 200)
-        else:
-            color, glow = COUNTDOWN_RED, QColor(255, 0, 0, 200)
-        
-        self.countdown_label.setStyleSheet(f"""
-            QLabel {{
-                color: {color};
-                font: bold 36pt "Cambria";
-                background: transparent;
-            }}
-        """)
+        if zone == self._last_zone:
+            return
+        self._last_zone = zone
+        
+        style, glow = _COUNTDOWN_ZONES[zone]
+        self.countdown_label.setStyleSheet(style)
         self.countdown_glow.setColor(glow)
     
     def _show_buff_alert(self):
         """Show buff alert."""
         self.buff_alert.setVisible(True)
-        self.buff_alert.raise_()
-        self.alert_pulse_timer.start(100)
     
     def _hide_buff_alert(self):
         """Hide buff alert."""
         self.buff_alert.setVisible(False)
-        self.alert_pulse_timer.stop()
         self.alert_pulse_state = 0
+        if not self.timer_mgr.is_running:
+            self.qt_timer.stop()
+    
+    def _on_frame(self):
+        """Advance the countdown and, every few frames, the alert pulse."""
+        self.timer_mgr.tick()
+        
+        self._frame += 1
+        if self._frame % self.ALERT_PULSE_FRAMES == 0 and self.buff_alert.isVisible():
+            self._pulse_alert()
     
     def _pulse_alert(self):
         """Animate buff alert pulsing."""
-        self.alert_pulse_state += 1
-        if self.alert_pulse_state % 2 == 0:
-            self.buff_alert_glow.setBlurRadius(40)
-            self.buff_alert_glow.setColor(QColor(255, 0, 0, 255))
-        else:
-            self.buff_alert_glow.setBlurRadius(25)
-            self.buff_alert_glow.setColor(QColor(255, 0, 0, 180))
+        self.alert_pulse_state ^= 1
+        i = self.alert_pulse_state
+        self.buff_alert_glow.setBlurRadius(self._pulse_radii[i])
+        self.buff_alert_glow.setColor(self._pulse_colors[i])
     
     # Window Events
     
@@ -430,10 +518,9 @@ class DarkCtrlKeeperWindow(QWidget):
             # Cleanup keyboard
             self.keyboard_mgr.cleanup()
             
-            # Stop timers
+            # Stop timer
             self.qt_timer.stop()
-            self.alert_pulse_timer.stop()
         except Exception as e:
-            print(f"Cleanup warning: {e}")
+            log.warning("Cleanup warning: %s", e)
         
         event.accept()
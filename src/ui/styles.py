@@ -5,35 +5,35 @@ UI Styles and Constants
 Centralized styling for all UI components.
 """
 
+from utils.resources import resource_path
+
+
+def _asset_url(relative_path: str) -> str:
+    """Absolute asset path in the forward-slash form Qt style sheets expect."""
+    return resource_path(relative_path).replace("\\", "/")
+
+
 # Radio button styling
-RADIO_BUTTON_STYLE = """
-    QRadioButton {
+# Indicator states are pre-rendered images of the former gradient circles
+# (20px = 16px content + 2px border), blitted instead of rasterized per paint
+RADIO_BUTTON_STYLE = f"""
+    QRadioButton {{
         color: #E8D5B7;
         font: bold 11pt "Georgia";
         spacing: 6px;
         background: transparent;
-    }
-    QRadioButton::indicator {
-        width: 16px;
-        height: 16px;
-        border-radius: 8px;
-        border: 2px solid rgba(160, 130, 75, 0.75);
-        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-            stop:0 rgba(48, 44, 62, 0.85),
-            stop:1 rgba(28, 24, 42, 0.90));
-    }
-    QRadioButton::indicator:hover {
-        border: 2px solid rgba(190, 155, 95, 0.90);
-        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-            stop:0 rgba(58, 54, 72, 0.90),
-            stop:1 rgba(38, 34, 52, 0.95));
-    }
-    QRadioButton::indicator:checked {
-        border: 2px solid rgba(255, 215, 0, 0.7);
-        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-            stop:0 rgba(255, 215, 0, 0.5),
-            stop:1 rgba(218, 165, 32, 0.6));
-    }
+    }}
+    QRadioButton::indicator {{
+        width: 20px;
+        height: 20px;
+        image: url("{_asset_url('assets/radio-indicator.png')}");
+    }}
+    QRadioButton::indicator:hover {{
+        image: url("{_asset_url('assets/radio-indicator-hover.png')}");
+    }}
+    QRadioButton::indicator:checked {{
+        image: url("{_asset_url('assets/radio-indicator-checked.png')}");
+    }}
 """
 
 # Watermark label styling
@@ -243,3 +243,15 @@ DIALOG_BUTTON_STYLE = """
 COUNTDOWN_GREEN = "#00FF00"
 COUNTDOWN_YELLOW = "#FFd900"
 COUNTDOWN_RED = "#FF0000"
+
+# Pre-built countdown stylesheets per color zone
+_COUNTDOWN_STYLE_TEMPLATE = """
+    QLabel {{
+        color: {color};
+        font: bold 36pt "Cambria";
+        background: transparent;
+    }}
+"""
+COUNTDOWN_STYLE_GREEN = _COUNTDOWN_STYLE_TEMPLATE.format(color=COUNTDOWN_GREEN)
+COUNTDOWN_STYLE_YELLOW = _COUNTDOWN_STYLE_TEMPLATE.format(color=COUNTDOWN_YELLOW)
+COUNTDOWN_STYLE_RED = _COUNTDOWN_STYLE_TEMPLATE.format(color=COUNTDOWN_RED)
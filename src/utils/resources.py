@@ -7,8 +7,18 @@ Helper functions for loading resources in both dev and PyInstaller modes.
 
 import os
 import sys
+from functools import lru_cache
 
+# The base path is fixed for the process lifetime, so resolve it once.
+# PyInstaller creates a temp folder and stores path in _MEIPASS;
+# when running as a script, use the current directory.
+if hasattr(sys, '_MEIPASS'):
+    _BASE_PATH = sys._MEIPASS
+else:
+    _BASE_PATH = os.path.abspath(".")
 
+
+@lru_cache(maxsize=128)
 def resource_path(relative_path: str) -> str:
     """
     Get absolute path to resource, works for dev and for PyInstaller.
@@ -22,11 +32,4 @@ def resource_path(relative_path: str) -> str:
     Returns:
         Absolute path to resource
     """
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        # Running as script - use current directory
-        base_path = os.path.abspath(".")
-    
-    return os.path.join(base_path, relative_path)
+    return os.path.join(_BASE_PATH, relative_path)